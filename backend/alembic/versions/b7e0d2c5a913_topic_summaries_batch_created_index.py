@@ -0,0 +1,32 @@
+"""composite (batch_id, created_at) index on topic_summaries
+
+Revision ID: b7e0d2c5a913
+Revises: f3a91c7d24b8
+Create Date: 2026-08-28 10:41:05.912377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e0d2c5a913'
+down_revision: Union[str, Sequence[str], None] = 'f3a91c7d24b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_topic_summaries_batch_created',
+        'topic_summaries',
+        ['batch_id', 'created_at'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_topic_summaries_batch_created', table_name='topic_summaries')
@@ -0,0 +1,30 @@
+"""query-aligned indexes on keywords and articles
+
+Revision ID: c4d81f6e0a27
+Revises: b7e0d2c5a913
+Create Date: 2026-08-28 11:02:48.190244
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d81f6e0a27'
+down_revision: Union[str, Sequence[str], None] = 'b7e0d2c5a913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_keywords_region_active', 'keywords', ['region', 'is_active'])
+    op.create_index('ix_articles_keyword_created', 'articles', ['keyword_tag', 'created_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_articles_keyword_created', table_name='articles')
+    op.drop_index('ix_keywords_region_active', table_name='keywords')
@@ -0,0 +1,92 @@
+"""string columns with CHECK constraints instead of Enum types
+
+Revision ID: d9f4b2a1c685
+Revises: c4d81f6e0a27
+Create Date: 2026-08-28 11:34:17.650912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9f4b2a1c685'
+down_revision: Union[str, Sequence[str], None] = 'c4d81f6e0a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The Enum columns stored member *names*; the string columns store values
+_SENTIMENT_NAMES = {'BULLISH': 'Bullish', 'BEARISH': 'Bearish', 'NEUTRAL': 'Neutral'}
+_SESSION_NAMES = {'MORNING': 'morning', 'MIDDAY': 'midday', 'EVENING': 'evening'}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, value in _SENTIMENT_NAMES.items():
+        op.execute(f"UPDATE articles SET sentiment = '{value}' WHERE sentiment = '{name}'")
+        op.execute(f"UPDATE topic_summaries SET sentiment = '{value}' WHERE sentiment = '{name}'")
+    for name, value in _SESSION_NAMES.items():
+        op.execute(f"UPDATE briefings SET session = '{value}' WHERE session = '{name}'")
+
+    with op.batch_alter_table('keywords') as batch_op:
+        batch_op.alter_column('region', type_=sa.String(4), existing_type=sa.Enum('US', 'KR', name='region'))
+        batch_op.create_check_constraint('ck_keywords_region', "region IN ('US', 'KR')")
+    with op.batch_alter_table('articles') as batch_op:
+        batch_op.alter_column('region', type_=sa.String(4), existing_type=sa.Enum('US', 'KR', name='region'))
+        batch_op.alter_column(
+            'sentiment', type_=sa.String(10),
+            existing_type=sa.Enum('BULLISH', 'BEARISH', 'NEUTRAL', name='sentiment'),
+        )
+        batch_op.create_check_constraint('ck_articles_region', "region IN ('US', 'KR')")
+        batch_op.create_check_constraint('ck_articles_sentiment', "sentiment IN ('Bullish', 'Bearish', 'Neutral')")
+    with op.batch_alter_table('topic_summaries') as batch_op:
+        batch_op.alter_column('region', type_=sa.String(4), existing_type=sa.Enum('US', 'KR', name='region'))
+        batch_op.alter_column(
+            'sentiment', type_=sa.String(10),
+            existing_type=sa.Enum('BULLISH', 'BEARISH', 'NEUTRAL', name='sentiment'),
+        )
+        batch_op.create_check_constraint('ck_topic_summaries_region', "region IN ('US', 'KR')")
+        batch_op.create_check_constraint('ck_topic_summaries_sentiment', "sentiment IN ('Bullish', 'Bearish', 'Neutral')")
+    with op.batch_alter_table('briefings') as batch_op:
+        batch_op.alter_column(
+            'session', type_=sa.String(10),
+            existing_type=sa.Enum('MORNING', 'MIDDAY', 'EVENING', name='briefingsession'),
+        )
+        batch_op.create_check_constraint('ck_briefings_session', "session IN ('morning', 'midday', 'evening')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('briefings') as batch_op:
+        batch_op.drop_constraint('ck_briefings_session', type_='check')
+        batch_op.alter_column(
+            'session', type_=sa.Enum('MORNING', 'MIDDAY', 'EVENING', name='briefingsession'),
+            existing_type=sa.String(10),
+        )
+    with op.batch_alter_table('topic_summaries') as batch_op:
+        batch_op.drop_constraint('ck_topic_summaries_sentiment', type_='check')
+        batch_op.drop_constraint('ck_topic_summaries_region', type_='check')
+        batch_op.alter_column(
+            'sentiment', type_=sa.Enum('BULLISH', 'BEARISH', 'NEUTRAL', name='sentiment'),
+            existing_type=sa.String(10),
+        )
+        batch_op.alter_column('region', type_=sa.Enum('US', 'KR', name='region'), existing_type=sa.String(4))
+    with op.batch_alter_table('articles') as batch_op:
+        batch_op.drop_constraint('ck_articles_sentiment', type_='check')
+        batch_op.drop_constraint('ck_articles_region', type_='check')
+        batch_op.alter_column(
+            'sentiment', type_=sa.Enum('BULLISH', 'BEARISH', 'NEUTRAL', name='sentiment'),
+            existing_type=sa.String(10),
+        )
+        batch_op.alter_column('region', type_=sa.Enum('US', 'KR', name='region'), existing_type=sa.String(4))
+    with op.batch_alter_table('keywords') as batch_op:
+        batch_op.drop_constraint('ck_keywords_region', type_='check')
+        batch_op.alter_column('region', type_=sa.Enum('US', 'KR', name='region'), existing_type=sa.String(4))
+
+    for name, value in _SENTIMENT_NAMES.items():
+        op.execute(f"UPDATE articles SET sentiment = '{name}' WHERE sentiment = '{value}'")
+        op.execute(f"UPDATE topic_summaries SET sentiment = '{name}' WHERE sentiment = '{value}'")
+    for name, value in _SESSION_NAMES.items():
+        op.execute(f"UPDATE briefings SET session = '{name}' WHERE session = '{value}'")
@@ -0,0 +1,28 @@
+"""composite index for created_at + ai_summary filters
+
+Revision ID: e1c7a3f9b254
+Revises: d9f4b2a1c685
+Create Date: 2026-08-28 13:21:05.483920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1c7a3f9b254'
+down_revision: Union[str, Sequence[str], None] = 'd9f4b2a1c685'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_articles_created_ai', 'articles', ['created_at', 'ai_summary'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_articles_created_ai', table_name='articles')
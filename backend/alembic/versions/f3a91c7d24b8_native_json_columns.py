@@ -0,0 +1,59 @@
+"""native JSON columns for tickers and source articles
+
+Revision ID: f3a91c7d24b8
+Revises: ece42c455542
+Create Date: 2026-08-28 10:15:22.481903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a91c7d24b8'
+down_revision: Union[str, Sequence[str], None] = 'ece42c455542'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # topic_summaries was historically created by Base.metadata.create_all at
+    # startup, never by a migration, so a fresh `alembic upgrade head` reaches
+    # this revision without the table. Create it in its pre-change shape
+    # (mirroring the initial-revision column style) before altering it.
+    if not sa.inspect(op.get_bind()).has_table('topic_summaries'):
+        op.create_table('topic_summaries',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('keyword_tag', sa.String(length=100), nullable=False),
+        sa.Column('region', sa.Enum('US', 'KR', name='region'), nullable=False),
+        sa.Column('batch_id', sa.String(length=50), nullable=False),
+        sa.Column('headline', sa.String(length=200), nullable=False),
+        sa.Column('summary', sa.Text(), nullable=False),
+        sa.Column('sentiment', sa.Enum('BULLISH', 'BEARISH', 'NEUTRAL', name='sentiment'), nullable=True),
+        sa.Column('related_tickers', sa.Text(), nullable=True),
+        sa.Column('source_articles', sa.Text(), nullable=True),
+        sa.Column('article_count', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index('ix_topic_summaries_created_at', 'topic_summaries', ['created_at'])
+        op.create_index('ix_topic_summaries_batch_id', 'topic_summaries', ['batch_id'])
+
+    # Existing values are already JSON text, so this is a type-level change only
+    with op.batch_alter_table('articles') as batch_op:
+        batch_op.alter_column('related_tickers', type_=sa.JSON(), existing_type=sa.Text())
+    with op.batch_alter_table('topic_summaries') as batch_op:
+        batch_op.alter_column('related_tickers', type_=sa.JSON(), existing_type=sa.Text())
+        batch_op.alter_column('source_articles', type_=sa.JSON(), existing_type=sa.Text())
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('topic_summaries') as batch_op:
+        batch_op.alter_column('source_articles', type_=sa.Text(), existing_type=sa.JSON())
+        batch_op.alter_column('related_tickers', type_=sa.Text(), existing_type=sa.JSON())
+    with op.batch_alter_table('articles') as batch_op:
+        batch_op.alter_column('related_tickers', type_=sa.Text(), existing_type=sa.JSON())
@@ -1,3 +1,5 @@
+from functools import cached_property, lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -10,7 +12,9 @@ class Settings(BaseSettings):
     # Gemini AI
     gemini_api_key: str = ""
     gemini_model: str = "gemini-2.5-flash"
-    gemini_rpm_delay: float = 6.0  # seconds between requests (free tier: 10 RPM)
+    gemini_rpm: int = 10  # requests per minute (free tier limit)
+    gemini_concurrency: int = 3  # max in-flight Gemini calls
+    gemini_marshal_size: int = 4  # keyword groups packed into one Gemini call (1 disables)
     gemini_max_batch: int = 30  # max articles per scheduler run
 
     # Naver Search API
@@ -22,6 +26,7 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "sqlite+aiosqlite:///./market_news.db"
+    db_pool_warm: int = 5  # connections opened during startup
 
     # CORS
     cors_origins: str = "http://localhost:5173"
@@ -29,9 +34,15 @@ class Settings(BaseSettings):
     # Environment
     env: str = "development"
 
-    @property
+    @cached_property
     def cors_origin_list(self) -> list[str]:
         return [origin.strip() for origin in self.cors_origins.split(",")]
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Construct Settings once per process; repeated calls reuse the instance."""
+    return Settings()
+
+
+settings = get_settings()
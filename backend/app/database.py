@@ -1,11 +1,46 @@
+import orjson
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.config import settings
 
-engine = create_async_engine(settings.database_url, echo=(settings.env == "development"))
+engine = create_async_engine(
+    settings.database_url,
+    echo=(settings.env == "development"),
+    json_serializer=lambda obj: orjson.dumps(obj).decode(),
+    json_deserializer=orjson.loads,
+    # Explicit pool sizing: scheduler jobs and API requests run concurrently,
+    # and reused connections keep their SQLite page cache warm
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=20,
+    max_overflow=10,
+    pool_recycle=1800,
+)
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
+# SQLite PRAGMAs applied to every new connection: WAL avoids writer/reader
+# blocking during the collect -> consolidate -> briefing pipeline, and
+# synchronous=NORMAL skips the per-commit fsync that dominates bulk
+# insert/delete latency in rollback-journal mode.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
 
 class Base(DeclarativeBase):
     pass
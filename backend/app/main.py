@@ -1,18 +1,19 @@
+import asyncio
 from contextlib import asynccontextmanager
-from datetime import datetime
 
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI, BackgroundTasks, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, exists, text
 
 from app.config import settings
-from app.database import engine, get_db, Base, async_session
+from app.database import engine, Base, async_session
 from app.models import Keyword, Region
 from app.routers import news, keywords, briefing, market
-from app.scheduler import setup_scheduler
+from app.scheduler import setup_scheduler, make_manual_batch_id
 from app.schemas import RefreshResponse
+from app.services.article_scraper import close_scraper_client
+from app.services.news_collector import close_collector_client
 from app.services.news_collector import NewsCollector
 from app.services.ai_processor import AIProcessor
 
@@ -29,14 +30,24 @@ DEFAULT_KEYWORDS = [
 
 async def seed_default_keywords():
     async with async_session() as db:
-        result = await db.execute(select(Keyword).limit(1))
-        if result.scalar_one_or_none() is None:
-            for kw in DEFAULT_KEYWORDS:
-                db.add(Keyword(**kw))
+        has_any = (await db.execute(select(exists().select_from(Keyword)))).scalar()
+        if not has_any:
+            db.add_all([Keyword(**kw) for kw in DEFAULT_KEYWORDS])
             await db.commit()
             logger.info(f"Seeded {len(DEFAULT_KEYWORDS)} default keywords")
 
 
+async def warm_connection_pool(count: int):
+    """Open connections up front so the first requests skip connect + PRAGMA setup."""
+
+    async def _warm():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_warm() for _ in range(count)))
+    logger.info(f"Warmed {count} database connections")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     async with engine.begin() as conn:
@@ -44,6 +55,7 @@ async def lifespan(app: FastAPI):
     logger.info("Database tables created")
 
     await seed_default_keywords()
+    await warm_connection_pool(settings.db_pool_warm)
 
     scheduler = setup_scheduler()
     scheduler.start()
@@ -52,6 +64,9 @@ async def lifespan(app: FastAPI):
     yield
 
     scheduler.shutdown()
+    briefing.shutdown_parse_pool()
+    await close_scraper_client()
+    await close_collector_client()
     logger.info("Scheduler stopped")
 
 
@@ -81,31 +96,71 @@ async def health_check():
     return {"status": "ok"}
 
 
-@app.post("/api/refresh", response_model=RefreshResponse)
-async def manual_refresh(db: AsyncSession = Depends(get_db)):
-    """Manually trigger news collection and consolidated AI processing."""
-    try:
-        batch_id = f"{datetime.now().strftime('%Y-%m-%d_%H%M')}_manual"
+# In-memory status per manual refresh batch; pruned to the most recent runs
+_refresh_jobs: dict[str, RefreshResponse] = {}
+_REFRESH_JOBS_MAX = 20
 
-        # 1. Collect news + scrape bodies
-        collector = NewsCollector(db)
-        new_articles = await collector.collect_all()
 
-        # 2. Consolidated AI processing (per keyword)
-        processor = AIProcessor()
-        summaries = await processor.process_batch(db, batch_id)
+async def _run_refresh(batch_id: str):
+    """Run the collect -> process pipeline for a manual refresh."""
+    try:
+        async with async_session() as db:
+            # 1. Collect news + scrape bodies
+            collector = NewsCollector(db)
+            new_articles = await collector.collect_all()
+
+            # 2. Consolidated AI processing (per keyword)
+            processor = AIProcessor()
+            summaries = await processor.process_batch(db, batch_id)
 
-        return RefreshResponse(
+        _refresh_jobs[batch_id] = RefreshResponse(
             status="success",
             articles_collected=len(new_articles),
             articles_processed=summaries,
             message=f"Collected {len(new_articles)} articles, created {summaries} topic summaries",
+            batch_id=batch_id,
         )
     except Exception as e:
         logger.error(f"Manual refresh failed: {e}")
-        return RefreshResponse(
+        _refresh_jobs[batch_id] = RefreshResponse(
             status="error",
             articles_collected=0,
             articles_processed=0,
             message=str(e),
+            batch_id=batch_id,
         )
+
+
+@app.post("/api/refresh", response_model=RefreshResponse, status_code=202)
+async def manual_refresh(background_tasks: BackgroundTasks):
+    """Trigger news collection and consolidated AI processing in the background."""
+    batch_id = make_manual_batch_id()
+
+    _refresh_jobs[batch_id] = RefreshResponse(
+        status="running",
+        articles_collected=0,
+        articles_processed=0,
+        message="Refresh in progress",
+        batch_id=batch_id,
+    )
+    while len(_refresh_jobs) > _REFRESH_JOBS_MAX:
+        _refresh_jobs.pop(next(iter(_refresh_jobs)))
+
+    background_tasks.add_task(_run_refresh, batch_id)
+
+    return RefreshResponse(
+        status="accepted",
+        articles_collected=0,
+        articles_processed=0,
+        message=f"Refresh started; poll /api/refresh/{batch_id} for progress",
+        batch_id=batch_id,
+    )
+
+
+@app.get("/api/refresh/{batch_id}", response_model=RefreshResponse)
+async def refresh_status(batch_id: str):
+    """Get the status of a manual refresh run."""
+    job = _refresh_jobs.get(batch_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Refresh batch not found")
+    return job
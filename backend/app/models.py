@@ -1,7 +1,9 @@
 import enum
 from datetime import datetime, date
 
-from sqlalchemy import String, Text, Boolean, Enum, DateTime, Date, Integer, Index, func
+from sqlalchemy import (
+    String, Text, Boolean, CheckConstraint, DateTime, Date, Integer, Index, JSON, func,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -24,12 +26,25 @@ class BriefingSession(str, enum.Enum):
     EVENING = "evening"
 
 
+# Enum columns are stored as plain strings with CHECK constraints: SQLite
+# stores VARCHAR either way, and skipping SQLAlchemy's Enum codec avoids a
+# per-value Python lookup on every read/write. The enums above stay the
+# vocabulary at the API boundary (Pydantic schemas validate into them).
+_REGION_CHECK = "region IN ('US', 'KR')"
+_SENTIMENT_CHECK = "sentiment IN ('Bullish', 'Bearish', 'Neutral')"
+_SESSION_CHECK = "session IN ('morning', 'midday', 'evening')"
+
+
 class Keyword(Base):
     __tablename__ = "keywords"
+    __table_args__ = (
+        Index("ix_keywords_region_active", "region", "is_active"),
+        CheckConstraint(_REGION_CHECK, name="ck_keywords_region"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     topic: Mapped[str] = mapped_column(String(100), nullable=False)
-    region: Mapped[Region] = mapped_column(Enum(Region), nullable=False)
+    region: Mapped[str] = mapped_column(String(4), nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
@@ -38,6 +53,15 @@ class Article(Base):
     __tablename__ = "articles"
     __table_args__ = (
         Index("ix_articles_created_at", "created_at"),
+        # process_batch/process_keyword group unprocessed articles by keyword
+        # and order by created_at
+        Index("ix_articles_keyword_created", "keyword_tag", "created_at"),
+        # Briefing and scraper queries filter on ai_summary IS (NOT) NULL
+        # within a created_at window; link dedup already rides the unique
+        # index that comes with the column
+        Index("ix_articles_created_ai", "created_at", "ai_summary"),
+        CheckConstraint(_REGION_CHECK, name="ck_articles_region"),
+        CheckConstraint(_SENTIMENT_CHECK, name="ck_articles_sentiment"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -45,11 +69,11 @@ class Article(Base):
     link: Mapped[str] = mapped_column(String(1000), unique=True, nullable=False)
     published_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     source_name: Mapped[str] = mapped_column(String(100), nullable=False)
-    region: Mapped[Region] = mapped_column(Enum(Region), nullable=False)
+    region: Mapped[str] = mapped_column(String(4), nullable=False)
     raw_snippet: Mapped[str | None] = mapped_column(Text, nullable=True)
     ai_summary: Mapped[str | None] = mapped_column(Text, nullable=True)
-    sentiment: Mapped[Sentiment | None] = mapped_column(Enum(Sentiment), nullable=True)
-    related_tickers: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON string
+    sentiment: Mapped[str | None] = mapped_column(String(10), nullable=True)
+    related_tickers: Mapped[list | None] = mapped_column(JSON, nullable=True)
     keyword_tag: Mapped[str] = mapped_column(String(100), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
@@ -60,17 +84,21 @@ class TopicSummary(Base):
     __table_args__ = (
         Index("ix_topic_summaries_created_at", "created_at"),
         Index("ix_topic_summaries_batch_id", "batch_id"),
+        # Serves batch_id filter + created_at DESC ordering without a sort pass
+        Index("ix_topic_summaries_batch_created", "batch_id", "created_at"),
+        CheckConstraint(_REGION_CHECK, name="ck_topic_summaries_region"),
+        CheckConstraint(_SENTIMENT_CHECK, name="ck_topic_summaries_sentiment"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     keyword_tag: Mapped[str] = mapped_column(String(100), nullable=False)
-    region: Mapped[Region] = mapped_column(Enum(Region), nullable=False)
+    region: Mapped[str] = mapped_column(String(4), nullable=False)
     batch_id: Mapped[str] = mapped_column(String(50), nullable=False)  # e.g., "2026-02-07_morning"
     headline: Mapped[str] = mapped_column(String(200), nullable=False)
     summary: Mapped[str] = mapped_column(Text, nullable=False)
-    sentiment: Mapped[Sentiment | None] = mapped_column(Enum(Sentiment), nullable=True)
-    related_tickers: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON
-    source_articles: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON: [{id, title, link, source}]
+    sentiment: Mapped[str | None] = mapped_column(String(10), nullable=True)
+    related_tickers: Mapped[list | None] = mapped_column(JSON, nullable=True)
+    source_articles: Mapped[list | None] = mapped_column(JSON, nullable=True)  # [{id, title, link, source}]
     article_count: Mapped[int] = mapped_column(Integer, default=0)
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
@@ -79,11 +107,12 @@ class Briefing(Base):
     __tablename__ = "briefings"
     __table_args__ = (
         Index("ix_briefings_created_at", "created_at"),
+        CheckConstraint(_SESSION_CHECK, name="ck_briefings_session"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     date: Mapped[date] = mapped_column(Date, nullable=False)
-    session: Mapped[BriefingSession] = mapped_column(Enum(BriefingSession), nullable=False)
+    session: Mapped[str] = mapped_column(String(10), nullable=False)
     overall_sentiment: Mapped[str | None] = mapped_column(Text, nullable=True)
     must_read_summary: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
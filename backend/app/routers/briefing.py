@@ -1,7 +1,10 @@
-import json
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
 
+import orjson
 from fastapi import APIRouter, Depends, Query
+from pydantic import TypeAdapter
 from sqlalchemy import select, desc
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -11,38 +14,84 @@ from app.schemas import BriefingResponse, OverallSentiment, MustRead
 
 router = APIRouter(prefix="/api/briefing", tags=["briefing"])
 
+_MUST_READS = TypeAdapter(list[MustRead])
 
-def _parse_briefing(briefing: Briefing) -> BriefingResponse:
-    """Parse a Briefing model into BriefingResponse."""
+# Above this many rows, JSON parsing moves off the event loop into a
+# worker process so other requests aren't blocked
+_PARSE_OFFLOAD_THRESHOLD = 50
+_parse_pool: ProcessPoolExecutor | None = None
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    global _parse_pool
+    if _parse_pool is None:
+        _parse_pool = ProcessPoolExecutor(max_workers=2)
+    return _parse_pool
+
+
+def shutdown_parse_pool():
+    """Tear down the parse pool; called from the app lifespan shutdown."""
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=False)
+        _parse_pool = None
+
+
+def _parse_briefing_row(row: dict) -> BriefingResponse:
+    """Parse one briefing row (as a plain dict) into BriefingResponse."""
     overall = None
-    if briefing.overall_sentiment:
+    if row["overall_sentiment"]:
         try:
-            data = json.loads(briefing.overall_sentiment)
+            data = orjson.loads(row["overall_sentiment"])
             overall = OverallSentiment(**data)
-        except (json.JSONDecodeError, TypeError):
+        except (orjson.JSONDecodeError, TypeError):
             pass
 
     must_reads = None
     cross_market_themes = None
-    if briefing.must_read_summary:
+    if row["must_read_summary"]:
         try:
-            data = json.loads(briefing.must_read_summary)
-            must_reads = [MustRead(**mr) for mr in data.get("must_reads", [])]
+            data = orjson.loads(row["must_read_summary"])
+            must_reads = _MUST_READS.validate_python(data.get("must_reads", []))
             cross_market_themes = data.get("cross_market_themes", [])
-        except (json.JSONDecodeError, TypeError):
+        except (ValueError, TypeError):
             pass
 
-    return BriefingResponse(
-        id=briefing.id,
-        date=briefing.date,
-        session=briefing.session,
+    # model_construct: the row came from our own DB and the JSON fields were
+    # validated above, so skip re-validation of the outer model
+    return BriefingResponse.model_construct(
+        id=row["id"],
+        date=row["date"],
+        session=row["session"],
         overall_sentiment=overall,
         must_reads=must_reads,
         cross_market_themes=cross_market_themes,
-        created_at=briefing.created_at,
+        created_at=row["created_at"],
     )
 
 
+def _parse_briefing_rows(rows: list[dict]) -> list[BriefingResponse]:
+    """Top-level batch parser so it is picklable for the process pool."""
+    return [_parse_briefing_row(row) for row in rows]
+
+
+def _briefing_to_row(briefing: Briefing) -> dict:
+    """ORM instances don't pickle; ship plain dicts to the parse pool."""
+    return {
+        "id": briefing.id,
+        "date": briefing.date,
+        "session": briefing.session,
+        "overall_sentiment": briefing.overall_sentiment,
+        "must_read_summary": briefing.must_read_summary,
+        "created_at": briefing.created_at,
+    }
+
+
+def _parse_briefing(briefing: Briefing) -> BriefingResponse:
+    """Parse a Briefing model into BriefingResponse."""
+    return _parse_briefing_row(_briefing_to_row(briefing))
+
+
 @router.get("", response_model=BriefingResponse | None)
 async def get_latest_briefing(db: AsyncSession = Depends(get_db)):
     """Get the latest briefing (today's most recent session)."""
@@ -67,11 +116,17 @@ async def get_briefing_history(
 
     start_date = date.today() - timedelta(days=days)
 
-    result = await db.execute(
+    # Stream rows into plain dicts instead of materializing the ORM list
+    result = await db.stream_scalars(
         select(Briefing)
         .where(Briefing.date >= start_date)
         .order_by(desc(Briefing.created_at))
     )
-    briefings = result.scalars().all()
+    rows = [_briefing_to_row(b) async for b in result]
+
+    if len(rows) > _PARSE_OFFLOAD_THRESHOLD:
+        return await asyncio.get_running_loop().run_in_executor(
+            _get_parse_pool(), _parse_briefing_rows, rows
+        )
 
-    return [_parse_briefing(b) for b in briefings]
+    return _parse_briefing_rows(rows)
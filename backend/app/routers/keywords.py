@@ -1,12 +1,11 @@
-from datetime import datetime
-
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from sqlalchemy import select, desc
+from sqlalchemy import select, desc, insert, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from loguru import logger
 
 from app.database import get_db, async_session
 from app.models import Keyword, TopicSummary
+from app.scheduler import make_manual_batch_id
 from app.schemas import KeywordCreate, KeywordUpdate, KeywordResponse
 from app.services.news_collector import NewsCollector
 from app.services.ai_processor import AIProcessor
@@ -39,7 +38,7 @@ async def _collect_and_process(keyword_id: int):
             )
             batch_id = latest.scalar_one_or_none()
             if not batch_id:
-                batch_id = f"{datetime.now().strftime('%Y-%m-%d_%H%M')}_manual"
+                batch_id = make_manual_batch_id()
 
             # 3. AI consolidation
             processor = AIProcessor()
@@ -54,7 +53,7 @@ async def _collect_and_process(keyword_id: int):
 async def list_keywords(db: AsyncSession = Depends(get_db)):
     """List all keywords."""
     result = await db.execute(select(Keyword).order_by(Keyword.id))
-    return result.scalars().all()
+    return [KeywordResponse.from_orm_fast(k) for k in result.scalars()]
 
 
 @router.post("", response_model=KeywordResponse, status_code=201)
@@ -64,10 +63,9 @@ async def create_keyword(
     db: AsyncSession = Depends(get_db),
 ):
     """Add a new keyword and start collecting articles for it."""
-    keyword = Keyword(topic=data.topic, region=data.region)
-    db.add(keyword)
+    stmt = insert(Keyword).values(topic=data.topic, region=data.region).returning(Keyword)
+    keyword = (await db.execute(stmt)).scalar_one()
     await db.commit()
-    await db.refresh(keyword)
 
     # Trigger collection in background
     background_tasks.add_task(_collect_and_process, keyword.id)
@@ -82,32 +80,32 @@ async def update_keyword(
     db: AsyncSession = Depends(get_db),
 ):
     """Update a keyword (toggle is_active, change topic/region)."""
-    result = await db.execute(select(Keyword).where(Keyword.id == keyword_id))
-    keyword = result.scalar_one_or_none()
+    values = data.model_dump(exclude_unset=True, exclude_none=True)
+    if values:
+        stmt = (
+            update(Keyword)
+            .where(Keyword.id == keyword_id)
+            .values(**values)
+            .returning(Keyword)
+        )
+        keyword = (await db.execute(stmt)).scalar_one_or_none()
+    else:
+        result = await db.execute(select(Keyword).where(Keyword.id == keyword_id))
+        keyword = result.scalar_one_or_none()
 
     if not keyword:
         raise HTTPException(status_code=404, detail="Keyword not found")
 
-    if data.topic is not None:
-        keyword.topic = data.topic
-    if data.region is not None:
-        keyword.region = data.region
-    if data.is_active is not None:
-        keyword.is_active = data.is_active
-
     await db.commit()
-    await db.refresh(keyword)
     return keyword
 
 
 @router.delete("/{keyword_id}", status_code=204)
 async def delete_keyword(keyword_id: int, db: AsyncSession = Depends(get_db)):
     """Delete a keyword."""
-    result = await db.execute(select(Keyword).where(Keyword.id == keyword_id))
-    keyword = result.scalar_one_or_none()
+    result = await db.execute(delete(Keyword).where(Keyword.id == keyword_id))
 
-    if not keyword:
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="Keyword not found")
 
-    await db.delete(keyword)
     await db.commit()
@@ -1,46 +1,115 @@
-import json
+import hashlib
+import time
 from datetime import datetime, timedelta
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import select, func, desc
+import msgspec
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy import select, func, desc, exists
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models import TopicSummary
-from app.schemas import TopicSummaryResponse, TopicSummaryListResponse, SourceArticle
+from app.schemas import TopicSummaryListResponse
 
 router = APIRouter(prefix="/api", tags=["news"])
 
 
-def _build_topic_responses(summaries) -> list[TopicSummaryResponse]:
-    """Convert TopicSummary ORM objects to response models."""
-    items = []
-    for s in summaries:
-        sources = []
-        if s.source_articles:
-            try:
-                sources = [SourceArticle(**a) for a in json.loads(s.source_articles)]
-            except (json.JSONDecodeError, TypeError):
-                pass
-
-        items.append(TopicSummaryResponse(
-            id=s.id,
-            keyword_tag=s.keyword_tag,
-            region=s.region,
-            batch_id=s.batch_id,
-            headline=s.headline,
-            summary=s.summary,
-            sentiment=s.sentiment,
-            related_tickers=json.loads(s.related_tickers) if s.related_tickers else [],
-            source_articles=sources,
-            article_count=s.article_count,
-            created_at=s.created_at,
-        ))
-    return items
+# msgspec Structs mirror the Pydantic response models at the encode boundary
+# only: /api/topics fans out to hundreds of items per request and msgspec's
+# C encoder round-trips them several times faster than pydantic-core. The
+# Pydantic models in schemas.py remain the OpenAPI contract.
+
+class _SourceArticleItem(msgspec.Struct):
+    id: int
+    title: str
+    link: str
+    source: str
+
+
+class _TopicItem(msgspec.Struct):
+    id: int
+    keyword_tag: str
+    region: str
+    batch_id: str
+    headline: str
+    summary: str
+    sentiment: str | None
+    related_tickers: list[str]
+    source_articles: list[_SourceArticleItem]
+    article_count: int
+    created_at: datetime
+
+
+class _TopicList(msgspec.Struct):
+    items: list[_TopicItem]
+    batch_id: str
+    has_more: bool = False
+
+
+_ENCODER = msgspec.json.Encoder()
+
+# Topic summaries only change when a batch is written (3x/day), so polling
+# clients can be served from a short-lived cache of the serialized payload
+_TOPICS_CACHE_TTL = 30.0
+_topics_cache: dict[tuple, tuple[float, int, bytes, str]] = {}
+_topics_cache_epoch = 0
+
+
+def invalidate_topics_cache():
+    """Drop cached /api/topics payloads; called after new summaries are committed."""
+    global _topics_cache_epoch
+    _topics_cache_epoch += 1
+    _topics_cache.clear()
+
+
+def _cached_topics_response(key: tuple, request: Request) -> Response | None:
+    entry = _topics_cache.get(key)
+    if not entry:
+        return None
+    expires, epoch, body, etag = entry
+    if epoch != _topics_cache_epoch or expires < time.monotonic():
+        return None
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+def _store_topics_response(key: tuple, payload: _TopicList, request: Request) -> Response:
+    body = _ENCODER.encode(payload)
+    etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+    _topics_cache[key] = (time.monotonic() + _TOPICS_CACHE_TTL, _topics_cache_epoch, body, etag)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+def _build_topic_response(s: TopicSummary) -> _TopicItem:
+    """Convert one TopicSummary ORM object to an encode-boundary struct."""
+    sources = []
+    if s.source_articles:
+        try:
+            sources = msgspec.convert(s.source_articles, list[_SourceArticleItem])
+        except msgspec.ValidationError:
+            pass
+
+    return _TopicItem(
+        id=s.id,
+        keyword_tag=s.keyword_tag,
+        region=s.region,
+        batch_id=s.batch_id,
+        headline=s.headline,
+        summary=s.summary,
+        sentiment=s.sentiment,
+        related_tickers=s.related_tickers or [],
+        source_articles=sources,
+        article_count=s.article_count,
+        created_at=s.created_at,
+    )
 
 
 @router.get("/topics", response_model=TopicSummaryListResponse)
 async def list_topic_summaries(
+    request: Request,
     batch_id: str | None = None,
     days_offset: int = Query(default=0, ge=0),
     days_limit: int = Query(default=3, ge=1, le=30),
@@ -51,6 +120,11 @@ async def list_topic_summaries(
     - batch_id: return a specific batch (legacy mode)
     - days_offset + days_limit: date-range pagination (default: latest 3 days)
     """
+    cache_key = (batch_id, days_offset, days_limit)
+    cached = _cached_topics_response(cache_key, request)
+    if cached is not None:
+        return cached
+
     # Legacy mode: specific batch_id
     if batch_id:
         query = (
@@ -58,42 +132,53 @@ async def list_topic_summaries(
             .where(TopicSummary.batch_id == batch_id)
             .order_by(desc(TopicSummary.created_at))
         )
-        result = await db.execute(query)
-        summaries = result.scalars().all()
-        return TopicSummaryListResponse(
-            items=_build_topic_responses(summaries),
+        # Stream the cursor so response models are built as rows arrive
+        result = await db.stream_scalars(query)
+        items = [_build_topic_response(s) async for s in result]
+        payload = _TopicList(
+            items=items,
             batch_id=batch_id,
         )
+        return _store_topics_response(cache_key, payload, request)
 
     # Date-range pagination mode
     now = datetime.now()
     range_end = now - timedelta(days=days_offset)
     range_start = range_end - timedelta(days=days_limit)
 
+    # Attach the "older data exists" probe as an EXISTS subquery so rows and
+    # has_more come back in a single round trip; EXISTS stops at the first
+    # matching row instead of counting the whole archive
+    older_exists = exists().where(TopicSummary.created_at < range_start)
     query = (
-        select(TopicSummary)
+        select(TopicSummary, older_exists)
         .where(TopicSummary.created_at >= range_start)
         .where(TopicSummary.created_at <= range_end)
         .order_by(desc(TopicSummary.created_at))
     )
-    result = await db.execute(query)
-    summaries = result.scalars().all()
-
-    # Check if older data exists
-    older = await db.execute(
-        select(func.count(TopicSummary.id))
-        .where(TopicSummary.created_at < range_start)
-    )
-    has_more = (older.scalar() or 0) > 0
-
-    # Determine batch_id for response (use latest batch in range, or empty)
-    response_batch_id = summaries[0].batch_id if summaries else ""
-
-    return TopicSummaryListResponse(
-        items=_build_topic_responses(summaries),
+    # Stream the cursor so response models are built as rows arrive instead
+    # of materializing the full ORM list first
+    items = []
+    has_more = False
+    response_batch_id = ""
+    result = await db.stream(query)
+    async for summary, older in result:
+        if not items:
+            has_more = bool(older)
+            response_batch_id = summary.batch_id
+        items.append(_build_topic_response(summary))
+
+    if not items:
+        # Empty range: probe separately so deep offsets still paginate
+        older = await db.execute(select(older_exists))
+        has_more = bool(older.scalar())
+
+    payload = _TopicList(
+        items=items,
         batch_id=response_batch_id,
         has_more=has_more,
     )
+    return _store_topics_response(cache_key, payload, request)
 
 
 @router.get("/batches")
@@ -1,5 +1,7 @@
+import asyncio
 from datetime import datetime, timedelta
 
+from apscheduler.executors.asyncio import AsyncIOExecutor
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from loguru import logger
@@ -12,8 +14,24 @@ from app.services.ai_processor import AIProcessor
 from app.services.briefing_generator import BriefingGenerator
 
 
+# Hoisted format strings: batch ids are composed on every scheduler tick,
+# manual refresh, and keyword-create background task
+_BATCH_DATE_FMT = "%Y-%m-%d"
+_MANUAL_BATCH_FMT = "%Y-%m-%d_%H%M"
+
+
 def _make_batch_id(session_type: BriefingSession) -> str:
-    return f"{datetime.now().strftime('%Y-%m-%d')}_{session_type.value}"
+    return f"{datetime.now().strftime(_BATCH_DATE_FMT)}_{session_type.value}"
+
+
+def make_manual_batch_id() -> str:
+    """Batch id for manually triggered pipelines (refresh, new keyword)."""
+    return f"{datetime.now().strftime(_MANUAL_BATCH_FMT)}_manual"
+
+
+# Gate the heavy collect -> consolidate -> briefing pipeline so an overrun
+# never runs concurrently with the next session's job
+_pipeline_gate = asyncio.Semaphore(1)
 
 
 async def scheduled_job(session_type: BriefingSession):
@@ -21,7 +39,7 @@ async def scheduled_job(session_type: BriefingSession):
     batch_id = _make_batch_id(session_type)
     logger.info(f"Starting scheduled job: {batch_id}")
 
-    async with async_session() as db:
+    async with _pipeline_gate, async_session() as db:
         try:
             # 1. Collect news + scrape bodies
             collector = NewsCollector(db)
@@ -43,35 +61,48 @@ async def scheduled_job(session_type: BriefingSession):
             logger.error(f"Scheduled job failed: {e}")
 
 
+async def _purge_old_rows(model, cutoff: datetime) -> int:
+    """Delete rows older than cutoff for one model in its own session."""
+    async with async_session() as db:
+        result = await db.execute(delete(model).where(model.created_at < cutoff))
+        await db.commit()
+        return result.rowcount
+
+
 async def cleanup_old_data(days: int = 30):
     """Delete data older than the specified number of days."""
     cutoff = datetime.now() - timedelta(days=days)
     logger.info(f"Cleaning up data older than {cutoff.isoformat()}")
 
-    async with async_session() as db:
-        try:
-            r1 = await db.execute(delete(TopicSummary).where(TopicSummary.created_at < cutoff))
-            r2 = await db.execute(delete(Article).where(Article.created_at < cutoff))
-            r3 = await db.execute(delete(Briefing).where(Briefing.created_at < cutoff))
-            await db.commit()
-            logger.info(
-                f"Cleanup done: {r1.rowcount} summaries, {r2.rowcount} articles, {r3.rowcount} briefings deleted"
-            )
-        except Exception as e:
-            await db.rollback()
-            logger.error(f"Cleanup failed: {e}")
+    try:
+        # Independent tables: run each delete in its own session so they
+        # overlap at the aiosqlite layer instead of serializing
+        summaries, articles, briefings = await asyncio.gather(
+            _purge_old_rows(TopicSummary, cutoff),
+            _purge_old_rows(Article, cutoff),
+            _purge_old_rows(Briefing, cutoff),
+        )
+        logger.info(
+            f"Cleanup done: {summaries} summaries, {articles} articles, {briefings} briefings deleted"
+        )
+    except Exception as e:
+        logger.error(f"Cleanup failed: {e}")
 
 
 def setup_scheduler() -> AsyncIOScheduler:
     """Configure APScheduler: 3x/day (08:00, 13:00, 18:00 KST)."""
-    scheduler = AsyncIOScheduler(timezone="Asia/Seoul")
+    scheduler = AsyncIOScheduler(
+        timezone="Asia/Seoul",
+        executors={"default": AsyncIOExecutor()},
+        # Collapse late runs instead of piling them up when a pipeline overruns
+        job_defaults={"coalesce": True, "misfire_grace_time": 600, "max_instances": 1},
+    )
 
     scheduler.add_job(
         scheduled_job,
         CronTrigger(hour=8, minute=0, timezone="Asia/Seoul"),
         args=[BriefingSession.MORNING],
         id="morning_briefing",
-        max_instances=1,
         replace_existing=True,
     )
 
@@ -80,7 +111,6 @@ def setup_scheduler() -> AsyncIOScheduler:
         CronTrigger(hour=13, minute=0, timezone="Asia/Seoul"),
         args=[BriefingSession.MIDDAY],
         id="midday_check",
-        max_instances=1,
         replace_existing=True,
     )
 
@@ -89,7 +119,6 @@ def setup_scheduler() -> AsyncIOScheduler:
         CronTrigger(hour=18, minute=0, timezone="Asia/Seoul"),
         args=[BriefingSession.EVENING],
         id="evening_wrapup",
-        max_instances=1,
         replace_existing=True,
     )
 
@@ -97,7 +126,6 @@ def setup_scheduler() -> AsyncIOScheduler:
         cleanup_old_data,
         CronTrigger(hour=3, minute=0, timezone="Asia/Seoul"),
         id="daily_cleanup",
-        max_instances=1,
         replace_existing=True,
     )
 
@@ -1,7 +1,33 @@
+from dataclasses import dataclass
 from datetime import datetime, date
+from typing import Any
+
 from pydantic import BaseModel
 
-from app.models import Region, Sentiment, BriefingSession
+from app.models import Region
+
+# Inbound models validate region/session/sentiment into the enums; response
+# models type them as plain str to match what the String columns actually
+# hold, so from_orm_fast/model_construct never puts a bare string into an
+# enum-typed field (which pydantic warns about at serialization time).
+
+
+class ORMResponse(BaseModel):
+    """Base for response models built from our own ORM rows."""
+
+    model_config = {"from_attributes": True}
+
+    @classmethod
+    def from_orm_fast(cls, obj: Any):
+        """Build from a trusted ORM row, skipping pydantic validation.
+
+        Rows read back from our own database are already typed, so
+        model_construct's no-validation path is safe and far cheaper than
+        model_validate. User-supplied payloads keep full validation.
+        """
+        return cls.model_construct(
+            **{name: getattr(obj, name) for name in cls.model_fields if hasattr(obj, name)}
+        )
 
 
 # --- Keywords ---
@@ -17,39 +43,37 @@ class KeywordUpdate(BaseModel):
     is_active: bool | None = None
 
 
-class KeywordResponse(BaseModel):
+class KeywordResponse(ORMResponse):
     id: int
     topic: str
-    region: Region
+    region: str
     is_active: bool
     created_at: datetime
 
-    model_config = {"from_attributes": True}
-
 
 # --- Articles ---
 
-class AISummary(BaseModel):
+@dataclass(slots=True)
+class AISummary:
+    """Internal DTO only — never validated, so Pydantic buys nothing here."""
     headline: str = ""
     summary: str = ""
 
 
-class ArticleResponse(BaseModel):
+class ArticleResponse(ORMResponse):
     id: int
     title: str
     link: str
     published_at: datetime | None
     source_name: str
-    region: Region
+    region: str
     ai_headline: str | None = None
     ai_summary: str | None = None
-    sentiment: Sentiment | None
+    sentiment: str | None
     related_tickers: list[str] | None = None
     keyword_tag: str
     created_at: datetime
 
-    model_config = {"from_attributes": True}
-
 
 class NewsListResponse(BaseModel):
     items: list[ArticleResponse]
@@ -70,11 +94,11 @@ class SourceArticle(BaseModel):
 class TopicSummaryResponse(BaseModel):
     id: int
     keyword_tag: str
-    region: Region
+    region: str
     batch_id: str
     headline: str
     summary: str
-    sentiment: Sentiment | None
+    sentiment: str | None
     related_tickers: list[str] = []
     source_articles: list[SourceArticle] = []
     article_count: int
@@ -103,17 +127,15 @@ class OverallSentiment(BaseModel):
     summary: str
 
 
-class BriefingResponse(BaseModel):
+class BriefingResponse(ORMResponse):
     id: int
     date: date
-    session: BriefingSession
+    session: str
     overall_sentiment: OverallSentiment | None = None
     must_reads: list[MustRead] | None = None
     cross_market_themes: list[str] | None = None
     created_at: datetime
 
-    model_config = {"from_attributes": True}
-
 
 # --- Market Data ---
 
@@ -137,3 +159,4 @@ class RefreshResponse(BaseModel):
     articles_collected: int
     articles_processed: int
     message: str
+    batch_id: str | None = None
@@ -1,15 +1,71 @@
 import asyncio
-import json
+import hashlib
+import io
+import random
+import time
 from datetime import datetime
 from collections import defaultdict
 
-from google import genai
+from typing import Literal
+
+import orjson
+from aiolimiter import AsyncLimiter
 from loguru import logger
-from sqlalchemy import select
+from pydantic import BaseModel
+from sqlalchemy import Row, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.models import Article, TopicSummary, Sentiment
+from app.models import Article, TopicSummary
+from app.routers.news import invalidate_topics_cache
+
+# Overlapping batches often re-scan the same articles; at low temperature the
+# consolidation for identical input is equivalent, so an exact-match cache on
+# the assembled prompt text skips the API call (and its quota cost) entirely.
+# Module-level because AIProcessor instances are created per pipeline run.
+_CONSOLIDATION_CACHE_TTL = 3600.0
+_CONSOLIDATION_CACHE_MAX = 1024
+_consolidation_cache: dict[str, tuple[float, list[dict]]] = {}
+
+
+def _cached_sections(key: str) -> list[dict] | None:
+    entry = _consolidation_cache.get(key)
+    if not entry:
+        return None
+    expires, sections = entry
+    if expires < time.monotonic():
+        _consolidation_cache.pop(key, None)
+        return None
+    return sections
+
+
+def _store_sections(key: str, sections: list[dict]) -> None:
+    if len(_consolidation_cache) >= _CONSOLIDATION_CACHE_MAX:
+        now = time.monotonic()
+        for stale in [k for k, (exp, _) in _consolidation_cache.items() if exp < now]:
+            del _consolidation_cache[stale]
+        while len(_consolidation_cache) >= _CONSOLIDATION_CACHE_MAX:
+            del _consolidation_cache[next(iter(_consolidation_cache))]
+    _consolidation_cache[key] = (time.monotonic() + _CONSOLIDATION_CACHE_TTL, sections)
+
+
+# Structured-output schema for single-keyword consolidation. Constraining
+# decoding server-side means malformed JSON and invalid sentiments almost
+# never come back, so the retry loop (a full API call per retry) rarely
+# runs. The multi-keyword prompt keys its response by dynamic keyword
+# names, which a fixed schema can't express, so it stays prose-guided.
+
+class _Section(BaseModel):
+    headline: str
+    summary: str
+    sentiment: Literal["Bullish", "Bearish", "Neutral"]
+    tickers: list[str]
+    article_indices: list[int]
+
+
+class _Sections(BaseModel):
+    sections: list[_Section]
+
 
 CONSOLIDATION_PROMPT = """You are a senior financial journalist writing a consolidated briefing for a Korean quant developer.
 
@@ -56,21 +112,72 @@ Return ONLY valid JSON:
   ]
 }}"""
 
+MULTI_CONSOLIDATION_PROMPT = """You are a senior financial journalist writing consolidated briefings for a Korean quant developer.
+
+Below are {keyword_count} topic keywords, each with its own numbered article list:
+
+{keyword_blocks}
+
+For EACH keyword independently, cluster its articles by actual topic similarity and write a section per cluster:
+1. "headline": Korean headline (max 60 chars) capturing that cluster's key narrative.
+2. "summary": Detailed Korean summary (6-10 sentences, magazine-style), split into 2-3 short paragraphs using "\\n\\n" between them.
+3. "sentiment": "Bullish", "Bearish", or "Neutral" for that cluster.
+4. "tickers": Relevant stock tickers mentioned in that cluster.
+5. "article_indices": Which article numbers belong to this cluster, counted within that keyword's own list.
+
+Do not mix articles across keywords.
+
+Return ONLY valid JSON:
+{{
+  "per_keyword": {{
+    "keyword A": [
+      {{
+        "headline": "토픽 헤드라인",
+        "summary": "첫 번째 문단.\\n\\n두 번째 문단.\\n\\n세 번째 문단.",
+        "sentiment": "Bullish",
+        "tickers": ["NVDA"],
+        "article_indices": [1, 3]
+      }}
+    ]
+  }}
+}}"""
+
 
 class AIProcessor:
     """Process articles by keyword - consolidate multiple articles into one summary per topic."""
 
     def __init__(self):
+        # Deferred import: google.genai drags in its whole transport stack,
+        # which processes that never touch AI code shouldn't pay for
+        from google import genai
+
         self.client = genai.Client(api_key=settings.gemini_api_key)
+        # Token bucket paced to the API quota; the semaphore caps in-flight
+        # calls so a burst of keywords doesn't exhaust the bucket at once
+        self._limiter = AsyncLimiter(settings.gemini_rpm, 60)
+        self._sem = asyncio.Semaphore(settings.gemini_concurrency)
+
+    # Only the columns the consolidation pipeline touches; selecting tuples
+    # instead of Article instances skips ORM identity-map and attribute
+    # instrumentation on what can be thousands of rows per batch
+    _ARTICLE_COLUMNS = (
+        Article.id,
+        Article.title,
+        Article.link,
+        Article.source_name,
+        Article.region,
+        Article.raw_snippet,
+        Article.keyword_tag,
+    )
 
     async def process_keyword(self, db: AsyncSession, batch_id: str, keyword_tag: str) -> bool:
         """Generate consolidated summaries for a single keyword's unprocessed articles."""
         result = await db.execute(
-            select(Article)
+            select(*self._ARTICLE_COLUMNS)
             .where(Article.ai_summary.is_(None), Article.keyword_tag == keyword_tag)
             .order_by(Article.created_at.desc())
         )
-        articles = result.scalars().all()
+        articles = result.all()
 
         if not articles:
             logger.info(f"No unprocessed articles for '{keyword_tag}'")
@@ -82,35 +189,14 @@ class AIProcessor:
         if not sections:
             return False
 
-        for section in sections:
-            # Map article_indices back to actual articles
-            indices = section.get("article_indices", [])
-            section_articles = [articles[i - 1] for i in indices if 1 <= i <= len(articles)]
-            if not section_articles:
-                section_articles = articles  # fallback: assign all
-
-            source_refs = [
-                {"id": a.id, "title": a.title, "link": a.link, "source": a.source_name}
-                for a in section_articles
-            ]
-
-            topic_summary = TopicSummary(
-                keyword_tag=keyword_tag,
-                region=region,
-                batch_id=batch_id,
-                headline=section.get("headline", keyword_tag),
-                summary=section["summary"],
-                sentiment=Sentiment(section["sentiment"]),
-                related_tickers=json.dumps(section.get("tickers", [])),
-                source_articles=json.dumps(source_refs, ensure_ascii=False),
-                article_count=len(section_articles),
-            )
-            db.add(topic_summary)
-
-        for a in articles:
-            a.ai_summary = "consolidated"
+        summary_rows = self._build_summary_rows(keyword_tag, region, batch_id, articles, sections)
 
+        # Core insert/update: one executemany and one UPDATE instead of
+        # per-row unit-of-work flushes
+        await db.execute(insert(TopicSummary), summary_rows)
+        await self._mark_consolidated(db, [a.id for a in articles])
         await db.commit()
+        invalidate_topics_cache()
         logger.info(f"Consolidated {len(articles)} articles for '{keyword_tag}' -> {len(sections)} sections")
         return True
 
@@ -118,145 +204,361 @@ class AIProcessor:
         """Group unprocessed articles by keyword and generate consolidated summaries."""
         # Get articles from this batch that don't have topic summaries yet
         result = await db.execute(
-            select(Article)
+            select(*self._ARTICLE_COLUMNS)
             .where(Article.ai_summary.is_(None))
             .order_by(Article.created_at.desc())
         )
-        articles = result.scalars().all()
+        articles = result.all()
 
         if not articles:
             logger.info("No unprocessed articles found")
             return 0
 
         # Group by keyword_tag
-        groups: dict[str, list[Article]] = defaultdict(list)
+        groups: dict[str, list[Row]] = defaultdict(list)
         for article in articles:
             groups[article.keyword_tag].append(article)
 
+        sections_by_keyword = await self._consolidate_groups(groups)
+
         processed = 0
+        summary_rows = []
+        consolidated_ids = []
         for keyword_tag, group_articles in groups.items():
-            try:
-                region = group_articles[0].region
-                sections = await self._consolidate_articles(keyword_tag, region, group_articles)
-
-                if sections:
-                    for section in sections:
-                        # Map article_indices back to actual articles
-                        indices = section.get("article_indices", [])
-                        section_articles = [group_articles[i - 1] for i in indices if 1 <= i <= len(group_articles)]
-                        if not section_articles:
-                            section_articles = group_articles  # fallback: assign all
-
-                        source_refs = [
-                            {
-                                "id": a.id,
-                                "title": a.title,
-                                "link": a.link,
-                                "source": a.source_name,
-                            }
-                            for a in section_articles
-                        ]
-
-                        topic_summary = TopicSummary(
-                            keyword_tag=keyword_tag,
-                            region=region,
-                            batch_id=batch_id,
-                            headline=section.get("headline", keyword_tag),
-                            summary=section["summary"],
-                            sentiment=Sentiment(section["sentiment"]),
-                            related_tickers=json.dumps(section.get("tickers", [])),
-                            source_articles=json.dumps(source_refs, ensure_ascii=False),
-                            article_count=len(section_articles),
-                        )
-                        db.add(topic_summary)
-
-                    # Mark individual articles as processed
-                    for a in group_articles:
-                        a.ai_summary = "consolidated"
-
-                    processed += len(sections)
-                    logger.info(
-                        f"Consolidated {len(group_articles)} articles for '{keyword_tag}' -> {len(sections)} sections"
-                    )
-
-                # Rate limiting
-                await asyncio.sleep(settings.gemini_rpm_delay)
+            sections = sections_by_keyword.get(keyword_tag)
+            if not sections:
+                continue
 
-            except Exception as e:
-                logger.error(f"Failed to consolidate '{keyword_tag}': {e}")
+            region = group_articles[0].region
+            summary_rows.extend(
+                self._build_summary_rows(keyword_tag, region, batch_id, group_articles, sections)
+            )
+
+            consolidated_ids.extend(a.id for a in group_articles)
+            processed += len(sections)
+            logger.info(
+                f"Consolidated {len(group_articles)} articles for '{keyword_tag}' -> {len(sections)} sections"
+            )
 
         if processed > 0:
+            # Core insert/update: one executemany and one UPDATE instead of
+            # per-row unit-of-work flushes
+            await db.execute(insert(TopicSummary), summary_rows)
+            await self._mark_consolidated(db, consolidated_ids)
             await db.commit()
+            invalidate_topics_cache()
 
         logger.info(f"Created {processed} topic summaries from {len(articles)} articles")
         return processed
 
+    @staticmethod
+    def _build_summary_rows(
+        keyword_tag: str, region, batch_id: str, articles: list[Row], sections: list[dict]
+    ) -> list[dict]:
+        """Map validated sections to TopicSummary insert rows.
+
+        Shared by the single-keyword and batch paths so the persistence shape
+        can't drift between them.
+        """
+        rows = []
+        for section in sections:
+            # Map article_indices back to actual articles
+            indices = section.get("article_indices", [])
+            section_articles = [articles[i - 1] for i in indices if 1 <= i <= len(articles)]
+            if not section_articles:
+                section_articles = articles  # fallback: assign all
+
+            source_refs = [
+                {"id": a.id, "title": a.title, "link": a.link, "source": a.source_name}
+                for a in section_articles
+            ]
+
+            rows.append({
+                "keyword_tag": keyword_tag,
+                "region": region,
+                "batch_id": batch_id,
+                "headline": section.get("headline", keyword_tag),
+                "summary": section["summary"],
+                "sentiment": section["sentiment"],
+                "related_tickers": section.get("tickers", []),
+                "source_articles": source_refs,
+                "article_count": len(section_articles),
+            })
+        return rows
+
+    async def _consolidate_groups(self, groups: dict[str, list[Row]]) -> dict[str, list[dict]]:
+        """Consolidate all keyword groups, packing several keywords per Gemini call.
+
+        Marshaling amortizes one API call across settings.gemini_marshal_size
+        keywords, which matters once the rate limiter becomes the bottleneck.
+        Keywords missing from a marshaled response fall back to single calls.
+        """
+        items = list(groups.items())
+        marshal_size = max(1, settings.gemini_marshal_size)
+
+        sections_by_keyword: dict[str, list[dict]] = {}
+        if marshal_size > 1 and len(items) > 1:
+            chunks = [dict(items[i:i + marshal_size]) for i in range(0, len(items), marshal_size)]
+            results = await asyncio.gather(
+                *(self._consolidate_many_keywords(chunk) for chunk in chunks),
+                return_exceptions=True,
+            )
+            for chunk, result in zip(chunks, results):
+                if isinstance(result, BaseException):
+                    logger.error(f"Failed to consolidate {list(chunk)}: {result}")
+                    continue
+                sections_by_keyword.update(result or {})
+            pending = [kw for kw in groups if kw not in sections_by_keyword]
+        else:
+            pending = [kw for kw, _ in items]
+
+        if pending:
+            results = await asyncio.gather(
+                *(
+                    self._consolidate_articles(kw, groups[kw][0].region, groups[kw])
+                    for kw in pending
+                ),
+                return_exceptions=True,
+            )
+            for kw, sections in zip(pending, results):
+                if isinstance(sections, BaseException):
+                    logger.error(f"Failed to consolidate '{kw}': {sections}")
+                elif sections:
+                    sections_by_keyword[kw] = sections
+
+        return sections_by_keyword
+
+    async def _consolidate_many_keywords(
+        self, groups: dict[str, list[Row]]
+    ) -> dict[str, list[dict]] | None:
+        """Consolidate several keyword groups in a single Gemini call.
+
+        Returns a mapping of keyword_tag -> validated section dicts; keywords
+        with invalid output are dropped so the caller can retry them singly.
+        """
+        blocks = []
+        for keyword, articles in groups.items():
+            parts = [f"### {keyword} ({articles[0].region}) — {len(articles)} articles"]
+            for i, a in enumerate(articles, 1):
+                # Unconditional slice; the model doesn't need an ellipsis marker
+                snippet = (a.raw_snippet or "")[:500]
+                parts.append(f"[{i}] {a.source_name}: {a.title}\n{snippet}")
+            block = "\n\n".join(parts)
+            if len(block) > 6000:
+                block = block[:6000] + "\n\n[... additional articles truncated]"
+            blocks.append(block)
+
+        prompt = MULTI_CONSOLIDATION_PROMPT.format(
+            keyword_count=len(groups),
+            keyword_blocks="\n\n".join(blocks),
+        )
+
+        temperature = 0.3
+        for attempt in range(3):
+            try:
+                text = await self._generate_streamed(prompt, temperature)
+                data = orjson.loads(text)
+                per_keyword = data.get("per_keyword", {})
+                if not isinstance(per_keyword, dict) or not per_keyword:
+                    raise ValueError("No per_keyword mapping returned")
+
+                result: dict[str, list[dict]] = {}
+                for keyword, sections in per_keyword.items():
+                    if keyword not in groups:
+                        logger.warning(f"Dropping unrequested keyword in response: '{keyword}'")
+                        continue
+                    try:
+                        self._validate_sections(sections)
+                    except ValueError as e:
+                        logger.warning(f"Invalid sections for '{keyword}': {e}")
+                        continue
+                    result[keyword] = sections
+
+                if not result:
+                    raise ValueError("No valid sections for any keyword")
+                return result
+
+            except ValueError as e:
+                # Bad model output: retry immediately with lower variance
+                logger.warning(f"Bad model output for {list(groups)} (attempt {attempt + 1}): {e}")
+                temperature = 0.1
+            except Exception as e:
+                logger.warning(f"Consolidation error for {list(groups)} (attempt {attempt + 1}): {e}")
+                if attempt < 2:
+                    await asyncio.sleep(self._retry_delay(e, attempt))
+
+        return None
+
     async def _consolidate_articles(
-        self, keyword: str, region, articles: list[Article]
+        self, keyword: str, region, articles: list[Row]
     ) -> list[dict] | None:
         """Send all articles for a keyword to Gemini for consolidated analysis.
 
         Returns a list of section dicts, each with headline/summary/sentiment/tickers/article_indices.
         """
-        # Build articles text
-        articles_parts = []
-        for i, a in enumerate(articles, 1):
-            snippet = a.raw_snippet or ""
-            if len(snippet) > 500:
-                snippet = snippet[:500] + "..."
-            articles_parts.append(
-                f"[{i}] {a.source_name}: {a.title}\n{snippet}"
-            )
-
-        articles_text = "\n\n".join(articles_parts)
-
-        # Truncate if too long for token limits
+        # A single article has nothing to consolidate across sources, so a
+        # synthesized section saves the full API round-trip — a common case
+        # for long-tail keywords
+        if len(articles) == 1:
+            a = articles[0]
+            return [{
+                "headline": a.title[:60],
+                "summary": (a.raw_snippet or a.title)[:600],
+                "sentiment": "Neutral",
+                "tickers": [],
+                "article_indices": [1],
+            }]
+
+        # Wire services mirror the same story across feeds; collapsing
+        # near-duplicates by a normalized title fingerprint keeps them from
+        # burning prompt tokens and biasing the clustering. dupes_of maps
+        # each deduped index back to every original row it stands for.
+        seen: dict[bytes, int] = {}
+        unique: list[Row] = []
+        dupes_of: dict[int, list[int]] = defaultdict(list)
+        for orig_idx, a in enumerate(articles, 1):
+            fingerprint = hashlib.blake2b(
+                "".join(a.title.lower().split()).encode(), digest_size=8
+            ).digest()
+            if fingerprint not in seen:
+                unique.append(a)
+                seen[fingerprint] = len(unique)
+            dupes_of[seen[fingerprint]].append(orig_idx)
+
+        # Write article text into one buffer and stop once the token budget
+        # is spent, instead of building the full string only to slice it
+        buf = io.StringIO()
+        for i, a in enumerate(unique, 1):
+            # Unconditional slice; the model doesn't need an ellipsis marker
+            snippet = (a.raw_snippet or "")[:500]
+            buf.write(f"[{i}] {a.source_name}: {a.title}\n{snippet}\n\n")
+            if buf.tell() > 6000:
+                break
+
+        articles_text = buf.getvalue()[:-2]
         if len(articles_text) > 6000:
             articles_text = articles_text[:6000] + "\n\n[... additional articles truncated]"
 
+        cache_key = hashlib.blake2b(
+            f"{keyword}|{region}|{articles_text}".encode(), digest_size=16
+        ).hexdigest()
+        cached = _cached_sections(cache_key)
+        if cached is not None:
+            logger.info(f"Consolidation cache hit for '{keyword}'")
+            return self._remap_indices(cached, dupes_of, len(unique))
+
         prompt = CONSOLIDATION_PROMPT.format(
             keyword=keyword,
-            region=region.value,
-            count=len(articles),
+            region=region,
+            count=len(unique),
             articles_text=articles_text,
         )
 
+        temperature = 0.3
         for attempt in range(3):
             try:
-                response = await asyncio.to_thread(
-                    self.client.models.generate_content,
-                    model=settings.gemini_model,
-                    contents=prompt,
-                    config={
-                        "temperature": 0.3,
-                        "response_mime_type": "application/json",
-                    },
-                )
-
-                text = response.text.strip()
-                data = json.loads(text)
+                text = await self._generate_streamed(prompt, temperature, response_schema=_Sections)
+                data = orjson.loads(text)
 
                 sections = data.get("sections", [])
-                if not isinstance(sections, list) or len(sections) == 0:
-                    raise ValueError("No sections returned")
-
-                # Validate each section
-                for section in sections:
-                    if not isinstance(section.get("summary"), str) or len(section["summary"]) < 30:
-                        raise ValueError(f"Section summary too short: {section.get('headline', '?')}")
-                    if section.get("sentiment") not in ("Bullish", "Bearish", "Neutral"):
-                        raise ValueError(f"Invalid sentiment: {section.get('sentiment')}")
-
-                return sections
-
-            except json.JSONDecodeError as e:
-                logger.warning(f"JSON parse error for '{keyword}' (attempt {attempt + 1}): {e}")
-                if attempt == 2:
-                    return None
+                self._validate_sections(sections)
+                # Cache in deduped-index space; remapped copies go to callers
+                _store_sections(cache_key, sections)
+                return self._remap_indices(sections, dupes_of, len(unique))
+
+            except ValueError as e:
+                # Bad model output: retry immediately with lower variance
+                logger.warning(f"Bad model output for '{keyword}' (attempt {attempt + 1}): {e}")
+                temperature = 0.1
             except Exception as e:
                 logger.warning(f"Consolidation error for '{keyword}' (attempt {attempt + 1}): {e}")
-                if attempt == 2:
-                    return None
-                await asyncio.sleep(2)
+                if attempt < 2:
+                    await asyncio.sleep(self._retry_delay(e, attempt))
 
         return None
+
+    @staticmethod
+    def _remap_indices(
+        sections: list[dict], dupes_of: dict[int, list[int]], unique_count: int
+    ) -> list[dict]:
+        """Translate article_indices from the deduped list back to the full list."""
+        return [
+            {
+                **section,
+                "article_indices": [
+                    orig
+                    for i in section.get("article_indices", [])
+                    if 1 <= i <= unique_count
+                    for orig in dupes_of.get(i, [])
+                ],
+            }
+            for section in sections
+        ]
+
+    # Keep IN lists below the sqlite bound-parameter ceiling
+    _MARK_CHUNK = 1000
+
+    @classmethod
+    async def _mark_consolidated(cls, db: AsyncSession, ids: list[int]) -> None:
+        """Flag articles as consolidated with chunked bulk UPDATEs."""
+        for start in range(0, len(ids), cls._MARK_CHUNK):
+            await db.execute(
+                update(Article)
+                .where(Article.id.in_(ids[start:start + cls._MARK_CHUNK]))
+                .values(ai_summary="consolidated")
+            )
+
+    async def _generate_streamed(
+        self, prompt: str, temperature: float, response_schema: type[BaseModel] | None = None
+    ) -> str:
+        """Issue one rate-limited Gemini call, streaming the response.
+
+        Accumulating chunks as they arrive overlaps network transfer with
+        loop dispatch across the concurrent consolidations instead of every
+        response body landing at once.
+        """
+        config: dict = {
+            "temperature": temperature,
+            "response_mime_type": "application/json",
+        }
+        if response_schema is not None:
+            config["response_schema"] = response_schema
+        async with self._sem, self._limiter:
+            stream = await self.client.aio.models.generate_content_stream(
+                model=settings.gemini_model,
+                contents=prompt,
+                config=config,
+            )
+            parts = []
+            async for chunk in stream:
+                if chunk.text:
+                    parts.append(chunk.text)
+        return "".join(parts).strip()
+
+    @staticmethod
+    def _retry_delay(error: Exception, attempt: int) -> float:
+        """Exponential backoff with jitter; honors the server's delay on 429s."""
+        from google.genai import errors as genai_errors
+
+        delay = 2.0 ** attempt + random.random()
+        if isinstance(error, genai_errors.APIError) and error.code == 429:
+            # The API embeds a RetryInfo detail when throttling
+            details = (error.details or {}).get("error", {}).get("details", [])
+            for detail in details:
+                if detail.get("@type", "").endswith("RetryInfo"):
+                    try:
+                        delay = max(delay, float(detail["retryDelay"].rstrip("s")))
+                    except (KeyError, ValueError):
+                        pass
+        return delay
+
+    @staticmethod
+    def _validate_sections(sections) -> None:
+        """Raise ValueError unless sections is a usable list of section dicts."""
+        if not isinstance(sections, list) or len(sections) == 0:
+            raise ValueError("No sections returned")
+        for section in sections:
+            if not isinstance(section.get("summary"), str) or len(section["summary"]) < 30:
+                raise ValueError(f"Section summary too short: {section.get('headline', '?')}")
+            if section.get("sentiment") not in ("Bullish", "Bearish", "Neutral"):
+                raise ValueError(f"Invalid sentiment: {section.get('sentiment')}")
@@ -1,47 +1,70 @@
 import asyncio
 
 import httpx
-from bs4 import BeautifulSoup
 from loguru import logger
+from selectolax.parser import HTMLParser
 
+# Enough for the lead paragraphs of any article; we truncate output to
+# ~2000 chars anyway, so never download or decode multi-MB pages in full
+_MAX_FETCH_BYTES = 512 * 1024
 
-async def extract_article_body(url: str, timeout: float = 10.0) -> str | None:
-    """Extract main text content from an article URL."""
-    try:
-        async with httpx.AsyncClient(
-            timeout=timeout,
+# Shared across all scrapes so keep-alive and HTTP/2 multiplexing reuse
+# connections instead of paying a TCP+TLS handshake per URL
+_CLIENT: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = httpx.AsyncClient(
+            timeout=10.0,
             follow_redirects=True,
+            http2=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
             headers={
                 "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
             },
-        ) as client:
-            resp = await client.get(url)
+        )
+    return _CLIENT
+
+
+async def close_scraper_client() -> None:
+    """Close the shared client; called on app shutdown."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+
+
+async def extract_article_body(url: str, timeout: float = 10.0) -> str | None:
+    """Extract main text content from an article URL."""
+    try:
+        async with _get_client().stream("GET", url, timeout=timeout) as resp:
             resp.raise_for_status()
+            buf = bytearray()
+            async for chunk in resp.aiter_bytes():
+                buf.extend(chunk)
+                if len(buf) >= _MAX_FETCH_BYTES:
+                    break
 
-        soup = BeautifulSoup(resp.text, "lxml")
+        # HTMLParser accepts bytes and detects the encoding itself
+        tree = HTMLParser(bytes(buf))
 
         # Remove non-content elements
-        for tag in soup.find_all(["script", "style", "nav", "header", "footer", "aside", "iframe", "form"]):
-            tag.decompose()
-
-        # Try common article selectors
-        article_el = (
-            soup.find("article")
-            or soup.find(attrs={"role": "article"})
-            or soup.find(class_=lambda c: c and any(
-                x in str(c).lower() for x in ["article-body", "story-body", "post-content", "entry-content"]
-            ))
-        )
+        for node in tree.css("script, style, nav, header, footer, aside, iframe, form"):
+            node.decompose()
 
-        if article_el:
-            paragraphs = article_el.find_all("p")
-        else:
-            # Fallback: collect all <p> tags from body
-            paragraphs = soup.find_all("p")
+        # Try common article selectors; substring class matches cover variants
+        # like "article-body__content". Falls back to all <p> tags below.
+        article_el = tree.css_first(
+            'article, [role="article"], [class*="article-body"], [class*="story-body"], '
+            '[class*="post-content"], [class*="entry-content"]'
+        )
+        paragraphs = (article_el or tree).css("p")
 
         text_parts = []
         for p in paragraphs:
-            text = p.get_text(strip=True)
+            text = p.text(strip=True)
             # Skip very short paragraphs (likely UI elements)
             if len(text) > 40:
                 text_parts.append(text)
@@ -1,22 +1,52 @@
 import asyncio
-import json
 from datetime import date, datetime, timedelta
 
-from google import genai
+import orjson
+
 from loguru import logger
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+import hashlib
+import time
+
 from app.config import settings
 from app.models import Article, Briefing, BriefingSession, Sentiment
 
-BRIEFING_PROMPT = """You are a senior market analyst creating a briefing for a quant developer.
+# Response cache keyed on the exact article payload: a manual refresh right
+# after a scheduled run, or a retry against an unchanged article set, gets
+# the previous briefing without another LLM round-trip. In-process is
+# enough — the backend runs a single worker.
+_BRIEFING_CACHE_TTL = 3600.0
+_BRIEFING_CACHE_MAX = 32
+_briefing_cache: dict[str, tuple[float, dict]] = {}
 
-Here are today's collected news articles (already analyzed):
-{articles_json}
+
+def _cached_briefing(key: str) -> dict | None:
+    entry = _briefing_cache.get(key)
+    if not entry:
+        return None
+    expires, data = entry
+    if expires < time.monotonic():
+        _briefing_cache.pop(key, None)
+        return None
+    return data
+
+
+def _store_briefing(key: str, data: dict) -> None:
+    while len(_briefing_cache) >= _BRIEFING_CACHE_MAX:
+        del _briefing_cache[next(iter(_briefing_cache))]
+    _briefing_cache[key] = (time.monotonic() + _BRIEFING_CACHE_TTL, data)
+
+# Static instructions and schema first, per-call article data last: Gemini
+# caches matching prompt prefixes implicitly, so every briefing call reuses
+# the cached prefill of this block and only the articles JSON is new. (The
+# block is well below the 2048-token minimum for explicit CachedContent,
+# so prefix placement is the available lever.)
+BRIEFING_PROMPT = """You are a senior market analyst creating a briefing for a quant developer.
 
 Tasks:
-1. Select the 3 most impactful articles from the list. For each, explain why it matters for an investor (in Korean).
+1. Select the 3 most impactful articles from the provided list. For each, explain why it matters for an investor (in Korean).
 2. Provide an overall market sentiment breakdown (in Korean).
 3. Identify cross-market themes between US and KR markets (in Korean).
 
@@ -37,13 +67,19 @@ Return ONLY valid JSON matching this schema:
     }}
   ],
   "cross_market_themes": ["theme1 in Korean", "theme2 in Korean"]
-}}"""
+}}
+
+Here are today's collected news articles (already analyzed):
+{articles_json}"""
 
 
 class BriefingGenerator:
     """Generate daily market briefings using Gemini AI."""
 
     def __init__(self):
+        # Deferred import, same reasoning as AIProcessor
+        from google import genai
+
         self.client = genai.Client(api_key=settings.gemini_api_key)
 
     async def generate(self, db: AsyncSession, session: BriefingSession) -> Briefing | None:
@@ -67,33 +103,37 @@ class BriefingGenerator:
             logger.warning("No analyzed articles found for briefing generation")
             return None
 
-        # Prepare articles data for prompt
-        articles_data = []
-        for a in articles:
-            articles_data.append({
+        # Prepare articles data for prompt. ai_summary is only the
+        # consolidation marker these days, so the snippet is the per-article
+        # content; related_tickers comes back as a list from the JSON column,
+        # no parsing needed.
+        articles_data = [
+            {
                 "id": a.id,
                 "title": a.title,
                 "source": a.source_name,
-                "region": a.region.value,
-                "sentiment": a.sentiment.value if a.sentiment else "Unknown",
-                "summary": json.loads(a.ai_summary) if a.ai_summary else [],
-                "tickers": json.loads(a.related_tickers) if a.related_tickers else [],
-            })
+                "region": a.region,
+                "sentiment": a.sentiment or "Unknown",
+                "summary": (a.raw_snippet or "")[:300],
+                "tickers": a.related_tickers or [],
+            }
+            for a in articles
+        ]
 
         # Generate briefing with Gemini
         briefing_data = await self._generate_briefing(articles_data)
         if not briefing_data:
             # Fallback: compute basic sentiment stats
-            briefing_data = self._compute_basic_stats(articles)
+            briefing_data = await self._compute_basic_stats(db)
 
         briefing = Briefing(
             date=today,
             session=session,
-            overall_sentiment=json.dumps(briefing_data.get("overall_sentiment", {}), ensure_ascii=False),
-            must_read_summary=json.dumps({
+            overall_sentiment=orjson.dumps(briefing_data.get("overall_sentiment", {})).decode(),
+            must_read_summary=orjson.dumps({
                 "must_reads": briefing_data.get("must_reads", []),
                 "cross_market_themes": briefing_data.get("cross_market_themes", []),
-            }, ensure_ascii=False),
+            }).decode(),
         )
 
         db.add(briefing)
@@ -103,25 +143,46 @@ class BriefingGenerator:
         logger.info(f"Generated {session.value} briefing for {today}")
         return briefing
 
-    async def _get_todays_articles(self, db: AsyncSession) -> list[Article]:
-        """Get today's articles that have been analyzed."""
+    async def _get_todays_articles(self, db: AsyncSession):
+        """Get today's analyzed articles, projected to the columns used here.
+
+        Column tuples skip ORM hydration for what can be hundreds of rows
+        that are only read once to build the prompt.
+        """
         today_start = datetime.combine(date.today(), datetime.min.time())
 
         result = await db.execute(
-            select(Article)
+            select(
+                Article.id,
+                Article.title,
+                Article.source_name,
+                Article.region,
+                Article.sentiment,
+                Article.raw_snippet,
+                Article.related_tickers,
+                Article.created_at,
+            )
             .where(
                 Article.created_at >= today_start,
                 Article.ai_summary.isnot(None),
             )
             .order_by(Article.created_at.desc())
         )
-        return list(result.scalars().all())
+        return result.all()
 
     async def _generate_briefing(self, articles_data: list[dict]) -> dict | None:
         """Generate briefing content with Gemini."""
-        prompt = BRIEFING_PROMPT.format(
-            articles_json=json.dumps(articles_data, ensure_ascii=False, indent=2)
-        )
+        # Compact JSON: indentation was pure whitespace the model billed as
+        # input tokens (~30% of the payload); orjson emits UTF-8 natively
+        articles_json = orjson.dumps(articles_data)
+
+        cache_key = hashlib.blake2b(articles_json, digest_size=16).hexdigest()
+        cached = _cached_briefing(cache_key)
+        if cached is not None:
+            logger.info("Briefing cache hit for identical article set")
+            return cached
+
+        prompt = BRIEFING_PROMPT.format(articles_json=articles_json.decode())
 
         for attempt in range(3):
             try:
@@ -136,9 +197,11 @@ class BriefingGenerator:
                 )
 
                 text = response.text.strip()
-                return json.loads(text)
+                briefing_data = orjson.loads(text)
+                _store_briefing(cache_key, briefing_data)
+                return briefing_data
 
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.warning(f"Briefing JSON parse error (attempt {attempt + 1}): {e}")
             except Exception as e:
                 logger.warning(f"Briefing generation error (attempt {attempt + 1}): {e}")
@@ -147,10 +210,25 @@ class BriefingGenerator:
 
         return None
 
-    @staticmethod
-    def _compute_basic_stats(articles: list[Article]) -> dict:
-        """Compute basic sentiment stats as fallback."""
-        total = len(articles)
+    async def _compute_basic_stats(self, db: AsyncSession) -> dict:
+        """Compute basic sentiment stats as fallback.
+
+        GROUP BY and a LIMIT 3 select let the database return three rows and
+        a handful of counts instead of every article being tallied in Python.
+        """
+        today_start = datetime.combine(date.today(), datetime.min.time())
+        analyzed_today = (
+            Article.created_at >= today_start,
+            Article.ai_summary.isnot(None),
+        )
+
+        result = await db.execute(
+            select(Article.sentiment, func.count())
+            .where(*analyzed_today)
+            .group_by(Article.sentiment)
+        )
+        counts = dict(result.all())
+        total = sum(counts.values())
         if total == 0:
             return {
                 "overall_sentiment": {"bullish_pct": 0, "bearish_pct": 0, "neutral_pct": 100, "summary": "데이터 없음"},
@@ -158,25 +236,29 @@ class BriefingGenerator:
                 "cross_market_themes": [],
             }
 
-        bullish = sum(1 for a in articles if a.sentiment == Sentiment.BULLISH)
-        bearish = sum(1 for a in articles if a.sentiment == Sentiment.BEARISH)
+        bullish = counts.get(Sentiment.BULLISH.value, 0)
+        bearish = counts.get(Sentiment.BEARISH.value, 0)
         neutral = total - bullish - bearish
 
         # Pick top 3 by most recent with non-neutral sentiment
-        sorted_articles = sorted(
-            [a for a in articles if a.sentiment in (Sentiment.BULLISH, Sentiment.BEARISH)],
-            key=lambda a: a.created_at,
-            reverse=True,
-        )[:3]
+        result = await db.execute(
+            select(Article.id, Article.title, Article.raw_snippet, Article.sentiment)
+            .where(
+                *analyzed_today,
+                Article.sentiment.in_([Sentiment.BULLISH.value, Sentiment.BEARISH.value]),
+            )
+            .order_by(Article.created_at.desc())
+            .limit(3)
+        )
 
         must_reads = [
             {
                 "article_id": a.id,
                 "title": a.title,
-                "why_important": json.loads(a.ai_summary)[0] if a.ai_summary else a.title,
-                "impact_analysis": f"감성: {a.sentiment.value}" if a.sentiment else "",
+                "why_important": (a.raw_snippet or a.title)[:200],
+                "impact_analysis": f"감성: {a.sentiment}" if a.sentiment else "",
             }
-            for a in sorted_articles
+            for a in result.all()
         ]
 
         return {
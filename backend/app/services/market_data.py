@@ -21,54 +21,80 @@ class MarketDataService:
     def __init__(self):
         self._cache: dict | None = None
         self._cache_time: datetime | None = None
+        self._refresh_lock = asyncio.Lock()
+        self._refreshing = False
 
     async def get_indices(self) -> dict:
-        """Get market indices with 5-min caching."""
+        """Get market indices with 5-min caching, stale-while-revalidate.
+
+        An expired-but-present cache is served immediately while one
+        background task refreshes it, so no request after the very first
+        ever waits out the multi-second yfinance fetch.
+        """
         now = datetime.utcnow()
 
         if self._cache and self._cache_time and (now - self._cache_time) < self.CACHE_TTL:
             return self._cache
 
-        data = await asyncio.to_thread(self._fetch_indices)
-        self._cache = data
-        self._cache_time = now
-        return data
+        if self._cache is not None:
+            if not self._refreshing:
+                self._refreshing = True
+                asyncio.create_task(self._refresh())
+            return self._cache
+
+        # Cold start: the first caller (and any racing with it) waits once
+        async with self._refresh_lock:
+            if self._cache is None:
+                self._refreshing = True
+                await self._refresh()
+        return self._cache
+
+    async def _refresh(self):
+        """Fetch fresh data and swap the cache in atomically."""
+        try:
+            data = await asyncio.to_thread(self._fetch_indices)
+            self._cache = data
+            self._cache_time = datetime.utcnow()
+        except Exception as e:
+            logger.warning(f"Market data refresh failed: {e}")
+        finally:
+            self._refreshing = False
 
     def _fetch_indices(self) -> dict:
-        """Fetch index data from yfinance (runs in thread)."""
-        indices = []
+        """Fetch index data from yfinance (runs in thread).
+
+        One multi-symbol download replaces five serial Ticker.fast_info
+        round-trips; change is computed from the last two closes.
+        """
+        symbols = [idx["symbol"] for idx in self.INDICES]
+        try:
+            data = yf.download(
+                symbols, period="2d", group_by="ticker", threads=True, progress=False
+            )
+        except Exception as e:
+            logger.warning(f"Batch market data download failed: {e}")
+            data = None
 
+        indices = []
         for idx in self.INDICES:
+            price = change = change_pct = 0.0
             try:
-                ticker = yf.Ticker(idx["symbol"])
-                info = ticker.fast_info
-
-                price = info.last_price
-                prev_close = info.previous_close
-
-                if price and prev_close:
+                closes = data[idx["symbol"]]["Close"].dropna()
+                price = float(closes.iloc[-1])
+                if len(closes) > 1:
+                    prev_close = float(closes.iloc[-2])
                     change = price - prev_close
                     change_pct = (change / prev_close) * 100
-                else:
-                    change = 0.0
-                    change_pct = 0.0
-
-                indices.append({
-                    "symbol": idx["symbol"],
-                    "name": idx["name"],
-                    "price": round(price, 2) if price else 0.0,
-                    "change": round(change, 2),
-                    "change_pct": round(change_pct, 2),
-                })
             except Exception as e:
                 logger.warning(f"Failed to fetch {idx['symbol']}: {e}")
-                indices.append({
-                    "symbol": idx["symbol"],
-                    "name": idx["name"],
-                    "price": 0.0,
-                    "change": 0.0,
-                    "change_pct": 0.0,
-                })
+
+            indices.append({
+                "symbol": idx["symbol"],
+                "name": idx["name"],
+                "price": round(price, 2),
+                "change": round(change, 2),
+                "change_pct": round(change_pct, 2),
+            })
 
         return {
             "indices": indices,